@@ -1,3 +1,4 @@
+import sys
 import time
 
 import pandas as pd
@@ -18,6 +19,9 @@ chrome_options.add_argument("--disable-dev-shm-usage")
 driver = webdriver.Chrome(options=chrome_options)
 print("Using Selenium's built-in driver manager")
 
+# Exit status: non-zero unless organizations were found and saved
+exit_code = 1
+
 try:
     # Navigate to AI Safety Map
     print("Navigating to AI Safety Map...")
@@ -72,10 +76,15 @@ try:
 
     print(f"Found {len(organizations)} organizations")
 
-    # Save to CSV
-    df = pd.DataFrame(organizations)
-    df.to_csv("generated/ai_safety_organizations.csv", index=False)
-    print("Organizations saved to ai_safety_organizations.csv")
+    # Save to CSV, unless the scrape came back empty: keep any previous list
+    # rather than overwriting it with one translation_coverage can't read
+    if organizations:
+        df = pd.DataFrame(organizations)
+        df.to_csv("generated/ai_safety_organizations.csv", index=False)
+        print("Organizations saved to ai_safety_organizations.csv")
+        exit_code = 0
+    else:
+        print("No organizations found, ai_safety_organizations.csv left unchanged")
 
 except Exception as main_error:
     print(f"An error occurred: {main_error}")
@@ -89,3 +98,5 @@ print("1. Visit https://aisafety.com/map in your browser")
 print("2. Manually identify and record 15-20 key organizations")
 print("3. Check each website for language options")
 print("4. This manual approach is sufficient for your blog post needs")
+
+sys.exit(exit_code)
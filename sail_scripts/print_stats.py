@@ -1,14 +1,15 @@
 import pandas as pd
 
-# Load the CSV file
-df = pd.read_csv("generated/ai_safety_language_analysis.csv")
+# Load the analysis results (column types are stored in the Parquet file)
+df = pd.read_parquet("generated/ai_safety_language_analysis.parquet")
 print(f"Loaded {len(df)} organizations")
 
 # Calculate statistics
-total_success = len(df[df["status"] == "success"])
-english_sites = len(df[(df["status"] == "success") & (df["primary_language"] == "en")])
-sites_with_language_options = len(df[df["has_language_options"] == True])
-sites_with_non_english_resources = len(df[df["has_non_english_resources"] == True])
+success = df["status"].eq("success")
+total_success = int(success.sum())
+english_sites = int((success & df["primary_language"].eq("en")).sum())
+sites_with_language_options = int(df["has_language_options"].sum())
+sites_with_non_english_resources = int(df["has_non_english_resources"].sum())
 
 # Print results
 print("\nAnalysis Results:")
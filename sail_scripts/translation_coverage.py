@@ -1,11 +1,28 @@
-import concurrent.futures
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 
-import langdetect
+import ahocorasick
+import aiohttp
+import marisa_trie
+import orjson
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
-from tqdm import tqdm
+import xxhash
+from diskcache import Cache
+from langdetect import PROFILES_DIRECTORY, DetectorFactory, LangDetectException
+from selectolax.lexbor import LexborHTMLParser
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+from tqdm.asyncio import tqdm
 
 # Headers to avoid being blocked
 headers = {
@@ -13,72 +30,204 @@ headers = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
+# Maximum number of websites fetched at the same time
+MAX_CONCURRENT_REQUESTS = 20
+
+# Time allowed for each fetch attempt, with unreachable hosts failing fast
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15, sock_connect=5)
+
+# Full results, with language options, are written here as they come in
+FULL_ANALYSIS_FILE = "generated/ai_safety_language_full_analysis.ndjson"
+
+# Successful analyses are cached on disk so re-runs don't fetch every site again.
+# Bump ANALYZER_VERSION whenever the detection logic changes, to skip old results
+RESULT_CACHE_DIR = "generated/.cache"
+RESULT_CACHE_EXPIRE = 7 * 86400
+ANALYZER_VERSION = 2
+
+
+# These exact language names are reliable indicators
+_LANGUAGE_NAMES = {
+    "english": "en",
+    "español": "es",
+    "spanish": "es",
+    "français": "fr",
+    "french": "fr",
+    "deutsch": "de",
+    "german": "de",
+    "italiano": "it",
+    "italian": "it",
+    "português": "pt",
+    "portuguese": "pt",
+    "русский": "ru",
+    "russian": "ru",
+    "中文": "zh",
+    "chinese": "zh",
+    "日本語": "ja",
+    "japanese": "ja",
+    "العربية": "ar",
+    "arabic": "ar",
+    "हिन्दी": "hi",
+    "hindi": "hi",
+}
+
+# Language names as a trie, to find the one a link text starts with in one lookup
+_LANG_NAME_TRIE = marisa_trie.Trie(list(_LANGUAGE_NAMES))
+
+# Two-letter language codes
+_LANG_CODES = frozenset(
+    ["en", "es", "fr", "de", "it", "pt", "ru", "zh", "ja", "ar", "hi"]
+)
+
+# Exclude domains/paths that commonly use language parameters but aren't language selectors
+_EXCLUDE_DOMAINS = (
+    "scholar.google.com",
+    "translate.google.com",
+    "accounts.google.com",
+    "twitter.com",
+    "facebook.com",
+    "linkedin.com",
+    "youtube.com",
+)
+
+# Hints in the id/name/class of a <select> that it picks a language
+_SELECT_LANG_INDICATORS = (
+    "lang",
+    "idioma",
+    "sprache",
+    "langue",
+    "language",
+    "locale",
+)
+
+# Hints in the id/class of a container that it is a language navigation
+_NAV_LANG_TERMS = (
+    "language-selector",
+    "lang-selector",
+    "language-menu",
+    "lang-menu",
+    "language-nav",
+    "lang-nav",
+    "language-switcher",
+    "lang-switcher",
+)
+
+# These highly specific ID patterns are extremely reliable indicators
+_LANG_ID_PATTERNS = (
+    "language-selector",
+    "languageSelector",
+    "language-switcher",
+    "languageSwitcher",
+    "lang-selector",
+    "langSelector",
+    "lang-switcher",
+    "langSwitcher",
+    "select-language",
+    "selectLanguage",
+    "change-language",
+    "changeLanguage",
+    "translate-button",
+    "translateButton",
+    "translation-menu",
+    "translationMenu",
+)
+# All the ID patterns as one selector, matched in a single traversal
+_LANG_ID_SELECTOR = ", ".join(f"#{pattern}" for pattern in _LANG_ID_PATTERNS)
+
+# Match patterns like /en/, /en-us/, etc.
+_LANG_PATH_RE = re.compile(r"/([a-z]{2})(?:-[a-z]{2})?(/|$|\?)")
+# Match patterns like ?lang=en, &language=fr
+_LANG_PARAM_RE = re.compile(r"[\?&](lang|language)=([a-z]{2})")
+# Classes of sections likely to list resources
+_RESOURCE_RE = re.compile("(resource|publication|paper|documentation)", re.I)
+
+# Tags the select, nav and script checks of detect_language_options look at
+_LANGUAGE_OPTION_SELECTOR = "select, nav, ul, div, script"
+
+
+# Language code of a link text that is a language code, a language name, or a
+# language name followed by a space (e.g. "english (uk)"), None otherwise
+def _match_language_name(text):
+    if text in _LANG_CODES:
+        return text
+    for name in _LANG_NAME_TRIE.prefixes(text):
+        if len(text) == len(name) or text[len(name)] == " ":
+            return _LANGUAGE_NAMES[name]
+    return None
+
+
+# Attribute value of a node, with missing and valueless attributes as ""
+def _attr(node, name):
+    return node.attributes.get(name) or ""
+
+
+# Short description of a matched tag, cheaper than serializing its whole subtree
+def _summarize(node):
+    classes = node.attributes.get("class")
+    return {
+        "tag": node.tag,
+        "id": node.attributes.get("id"),
+        "classes": classes.split() if classes else None,
+        "text": node.text(separator=" ", strip=True)[:200],
+    }
 
-def detect_language_options(soup):
+
+def detect_language_options(tree):
     """
     Highly precise detection of genuine language selection options.
     Filters out common false positives, including Google Scholar links.
+
+    The cheap and reliable hreflang and Google Translate checks run first,
+    and the other approaches are skipped when one of them finds options.
     """
-    language_options = []
+    # Approach 4: Check for alternate language versions via hreflang
+    # This is the most reliable indicator as it's the web standard for language alternatives
+    alt_langs = set()
+    for link in tree.css("link[rel~=alternate][hreflang]"):
+        lang_code = _attr(link, "hreflang").lower()
+        if lang_code and lang_code != "en" and lang_code != "x-default":
+            alt_langs.add(lang_code)
 
-    # These exact language names are reliable indicators
-    language_names = {
-        "english": "en",
-        "español": "es",
-        "spanish": "es",
-        "français": "fr",
-        "french": "fr",
-        "deutsch": "de",
-        "german": "de",
-        "italiano": "it",
-        "italian": "it",
-        "português": "pt",
-        "portuguese": "pt",
-        "русский": "ru",
-        "russian": "ru",
-        "中文": "zh",
-        "chinese": "zh",
-        "日本語": "ja",
-        "japanese": "ja",
-        "العربية": "ar",
-        "arabic": "ar",
-        "हिन्दी": "hi",
-        "hindi": "hi",
-    }
+    if alt_langs:
+        return [
+            {
+                "type": "alternate_hreflang",
+                "languages": list(alt_langs),
+                "count": len(alt_langs),
+            }
+        ]
 
-    # Two-letter language codes
-    language_codes = ["en", "es", "fr", "de", "it", "pt", "ru", "zh", "ja", "ar", "hi"]
-
-    # Exclude domains/paths that commonly use language parameters but aren't language selectors
-    exclude_domains = [
-        "scholar.google.com",
-        "translate.google.com",
-        "accounts.google.com",
-        "twitter.com",
-        "facebook.com",
-        "linkedin.com",
-        "youtube.com",
-    ]
+    # Approach 5: Look for Google Translate (very specific patterns)
+    gt_element = tree.css_first("#google_translate_element")
+    if gt_element:
+        return [{"type": "google_translate", "content": _summarize(gt_element)}]
+
+    language_options = []
+
+    # Match the tree once and sort the tags each approach needs into buckets
+    selects = []
+    navs = []
+    scripts = []
+    for el in tree.css(_LANGUAGE_OPTION_SELECTOR):
+        name = el.tag
+        if name == "select":
+            selects.append(el)
+        elif name in ("nav", "ul", "div"):
+            navs.append(el)
+        elif name == "script":
+            scripts.append(el)
 
     # Approach 1: Look for dedicated language selector dropdowns
-    for select in soup.find_all("select"):
-        options = select.find_all("option")
+    for select in selects:
+        options = select.css("option")
         if 2 <= len(options) <= 15:  # Language selects typically have few options
             # Check if the select element has indicators in its name or classes
             has_lang_indicator = False
-            select_id = select.get("id", "").lower()
-            select_name = select.get("name", "").lower()
-            select_classes = " ".join(select.get("class", [])).lower()
-
-            lang_indicators = [
-                "lang",
-                "idioma",
-                "sprache",
-                "langue",
-                "language",
-                "locale",
-            ]
-            for indicator in lang_indicators:
+            select_id = _attr(select, "id").lower()
+            select_name = _attr(select, "name").lower()
+            select_classes = _attr(select, "class").lower()
+
+            for indicator in _SELECT_LANG_INDICATORS:
                 if (
                     indicator in select_id
                     or indicator in select_name
@@ -89,24 +238,21 @@ def detect_language_options(soup):
 
             if not has_lang_indicator:
                 # Check if options contain language codes or names
-                option_values = [opt.get("value", "").lower() for opt in options]
-                option_texts = [opt.get_text().strip().lower() for opt in options]
+                option_values = [_attr(opt, "value").lower() for opt in options]
+                option_texts = [opt.text().strip().lower() for opt in options]
 
                 # Count language matches in values and texts
-                lang_code_matches = sum(
-                    1
-                    for code in language_codes
-                    if any(
-                        val == code
-                        or val.startswith(f"{code}-")
-                        or val.startswith(f"{code}_")
+                lang_code_matches = len(
+                    {
+                        val[:2]
                         for val in option_values
-                    )
+                        if val[:2] in _LANG_CODES and (len(val) == 2 or val[2] in "-_")
+                    }
                 )
 
                 lang_name_matches = sum(
                     1
-                    for name in language_names
+                    for name in _LANGUAGE_NAMES
                     if any(name in text for text in option_texts)
                 )
 
@@ -117,32 +263,24 @@ def detect_language_options(soup):
                             "type": "language_select",
                             "matched_codes": lang_code_matches,
                             "matched_names": lang_name_matches,
-                            "content": str(select)[:200],
+                            "content": _summarize(select),
                         }
                     )
 
     # Approach 2: Look for groups of language option links
     # Only consider clear language navigation groups
-    for nav in soup.find_all(["nav", "ul", "div"]):
+    for nav in navs:
         # Skip large containers that are unlikely to be just language selectors
-        if len(nav.find_all()) > 20:
+        # (css() matches the container itself too)
+        if len(nav.css("*")) - 1 > 20:
             continue
 
         # First check if this element is explicitly marked as language navigation
-        nav_id = nav.get("id", "").lower()
-        nav_classes = " ".join(nav.get("class", [])).lower()
+        nav_id = _attr(nav, "id").lower()
+        nav_classes = _attr(nav, "class").lower()
 
         explicit_lang_element = False
-        for term in [
-            "language-selector",
-            "lang-selector",
-            "language-menu",
-            "lang-menu",
-            "language-nav",
-            "lang-nav",
-            "language-switcher",
-            "lang-switcher",
-        ]:
+        for term in _NAV_LANG_TERMS:
             if term in nav_id or term in nav_classes:
                 explicit_lang_element = True
                 break
@@ -151,33 +289,31 @@ def detect_language_options(soup):
         required_matches = 1 if explicit_lang_element else 2
 
         # Get all links in this navigation element
-        links = nav.find_all("a")
+        links = nav.css("a")
         if 2 <= len(links) <= 10:  # Language menus typically have few options
             # Filter out links to external sites in our exclusion list
             filtered_links = []
             for link in links:
-                href = link.get("href", "")
-                if not any(domain in href for domain in exclude_domains):
+                href = _attr(link, "href")
+                if not any(domain in href for domain in _EXCLUDE_DOMAINS):
                     filtered_links.append(link)
 
             if len(filtered_links) < 2:
                 continue
 
             # Check both href values and link text
-            href_values = [link.get("href", "").lower() for link in filtered_links]
-            link_texts = [link.get_text().strip().lower() for link in filtered_links]
+            href_values = [_attr(link, "href").lower() for link in filtered_links]
+            link_texts = [link.text().strip().lower() for link in filtered_links]
 
             # Look for dedicated language path patterns (/en/, /fr/, etc.)
             lang_path_matches = []
             for i, href in enumerate(href_values):
-                # Match patterns like /en/, /en-us/, etc.
-                path_match = re.search(r"/([a-z]{2})(?:-[a-z]{2})?(/|$|\?)", href)
-                if path_match and path_match.group(1) in language_codes:
+                path_match = _LANG_PATH_RE.search(href)
+                if path_match and path_match.group(1) in _LANG_CODES:
                     lang_path_matches.append(path_match.group(1))
 
-                # Match patterns like ?lang=en, &language=fr
-                param_match = re.search(r"[\?&](lang|language)=([a-z]{2})", href)
-                if param_match and param_match.group(2) in language_codes:
+                param_match = _LANG_PARAM_RE.search(href)
+                if param_match and param_match.group(2) in _LANG_CODES:
                     # Special case: Exclude Google Scholar's hl parameter
                     if "hl=" in href and "scholar.google" in href:
                         continue
@@ -187,14 +323,9 @@ def detect_language_options(soup):
             unique_lang_paths = set(lang_path_matches)
 
             # Count language name matches in text
-            text_lang_matches = []
-            for text in link_texts:
-                for name, code in language_names.items():
-                    if text == name or text == code or text.startswith(name + " "):
-                        text_lang_matches.append(code)
-                        break
+            text_lang_matches = [_match_language_name(text) for text in link_texts]
 
-            unique_text_matches = set(text_lang_matches)
+            unique_text_matches = set(text_lang_matches) - {None}
 
             # If we found multiple distinct languages, this is likely a language menu
             all_matches = unique_lang_paths.union(unique_text_matches)
@@ -204,75 +335,34 @@ def detect_language_options(soup):
                         "type": "language_menu",
                         "matched_paths": list(unique_lang_paths),
                         "matched_names": list(unique_text_matches),
-                        "content": str(nav)[:200],
+                        "content": _summarize(nav),
                     }
                 )
 
     # Approach 3: Check for these highly specific ID patterns
-    # These are extremely reliable indicators
-    lang_id_patterns = [
-        "language-selector",
-        "languageSelector",
-        "language-switcher",
-        "languageSwitcher",
-        "lang-selector",
-        "langSelector",
-        "lang-switcher",
-        "langSwitcher",
-        "select-language",
-        "selectLanguage",
-        "change-language",
-        "changeLanguage",
-        "translate-button",
-        "translateButton",
-        "translation-menu",
-        "translationMenu",
-    ]
+    id_elements = {}
+    for element in tree.css(_LANG_ID_SELECTOR):
+        id_elements.setdefault(element.attributes.get("id"), element)
 
-    for pattern in lang_id_patterns:
-        element = soup.find(id=pattern)
+    for pattern in _LANG_ID_PATTERNS:
+        element = id_elements.get(pattern)
         if element:
             # Further validate it's not a false positive
-            if (
-                len(element.find_all("a")) >= 1
-                or len(element.find_all("select")) >= 1
-                or len(element.find_all("button")) >= 1
+            if any(
+                child.css_first("a, select, button") is not None
+                for child in element.iter()
             ):
                 language_options.append(
                     {
                         "type": "id_exact_match",
                         "pattern": pattern,
-                        "content": str(element)[:200],
+                        "content": _summarize(element),
                     }
                 )
 
-    # Approach 4: Check for alternate language versions via hreflang
-    # This is the most reliable indicator as it's the web standard for language alternatives
-    alt_langs = set()
-    for link in soup.find_all("link", attrs={"rel": "alternate", "hreflang": True}):
-        lang_code = link.get("hreflang", "").lower()
-        if lang_code and lang_code != "en" and lang_code != "x-default":
-            alt_langs.add(lang_code)
-
-    if alt_langs:
-        language_options.append(
-            {
-                "type": "alternate_hreflang",
-                "languages": list(alt_langs),
-                "count": len(alt_langs),
-            }
-        )
-
-    # Approach 5: Look for Google Translate (very specific patterns)
-    gt_element = soup.find(id="google_translate_element")
-    if gt_element:
-        language_options.append(
-            {"type": "google_translate", "content": str(gt_element)[:200]}
-        )
-
     # Check for Google Translate script with specific implementation pattern
-    for script in soup.find_all("script"):
-        script_text = script.string if script.string else ""
+    for script in scripts:
+        script_text = script.text()
         if script_text and "new google.translate.TranslateElement" in script_text:
             language_options.append(
                 {
@@ -285,153 +375,274 @@ def detect_language_options(soup):
     return language_options
 
 
+# Languages langdetect can answer with; the other profiles are never matched
+# against the languages we look for and would only take up memory
+LANGDETECT_LANGUAGES = frozenset(
+    {
+        "en",
+        "es",
+        "fr",
+        "de",
+        "it",
+        "pt",
+        "ru",
+        "zh-cn",
+        "zh-tw",
+        "ja",
+        "ar",
+        "hi",
+        "ko",
+        "bn",
+        "id",
+    }
+)
+
+
+def _read_langdetect_profile(lang):
+    with open(os.path.join(PROFILES_DIRECTORY, lang), encoding="utf-8") as f:
+        return f.read()
+
+
+# Load the language profiles once at import, then create a cheap detector per text
+_factory = DetectorFactory()
+_factory.load_json_profile(
+    [_read_langdetect_profile(lang) for lang in sorted(LANGDETECT_LANGUAGES)]
+)
+
+
+# Detected languages keyed by a fingerprint of the text, kept between runs so
+# pages sharing the same boilerplate are only detected once
+LANG_CACHE_FILE = "generated/lang_cache.json"
+_lang_cache = {}
+# Languages detected since the last _pop_new_langs(), for worker processes to
+# hand back to the parent's cache
+_new_langs = {}
+
+
+def load_lang_cache(path=LANG_CACHE_FILE):
+    try:
+        with open(path) as f:
+            _lang_cache.update(json.load(f))
+    except FileNotFoundError:
+        pass
+
+
+def save_lang_cache(path=LANG_CACHE_FILE):
+    with open(path, "w") as f:
+        json.dump(_lang_cache, f)
+
+
+def _pop_new_langs():
+    new_langs = dict(_new_langs)
+    _new_langs.clear()
+    return new_langs
+
+
+def _detect(text):
+    key = xxhash.xxh64_hexdigest(text[:4096].encode("utf-8"))
+    lang = _lang_cache.get(key)
+    if lang is None:
+        detector = _factory.create()
+        detector.append(text)
+        try:
+            lang = detector.detect()
+        except LangDetectException:
+            lang = "unknown"
+        _lang_cache[key] = _new_langs[key] = lang
+    return lang
+
+
 # Function to detect the primary language of a website
-def detect_primary_language(soup):
+def detect_primary_language(tree):
     # 1. Check HTML lang attribute (most reliable)
-    html_tag = soup.find("html")
-    if html_tag and "lang" in html_tag.attrs:
-        lang_attr = html_tag["lang"].lower()
+    html_tag = tree.css_first("html")
+    if html_tag and "lang" in html_tag.attributes:
+        lang_attr = _attr(html_tag, "lang").lower()
         if "-" in lang_attr:
             # Extract primary language code from formats like 'en-US'
             return lang_attr.split("-")[0]
         return lang_attr
 
     # 2. If no lang attribute, try content-language meta tag
-    meta_lang = soup.find("meta", attrs={"http-equiv": "content-language"})
-    if meta_lang and "content" in meta_lang.attrs:
-        return meta_lang["content"].lower().split("-")[0]
+    meta_lang = tree.css_first('meta[http-equiv="content-language"]')
+    if meta_lang and "content" in meta_lang.attributes:
+        return _attr(meta_lang, "content").lower().split("-")[0]
 
     # 3. Last resort: detect language from content
     try:
         # Get text from paragraphs (more reliable than full page)
-        paragraphs = soup.find_all("p")
+        paragraphs = tree.css("p")
         if paragraphs:
             # Join first 5 paragraphs or all if fewer
-            text = " ".join([p.get_text().strip() for p in paragraphs[:5]])
+            text = " ".join([p.text().strip() for p in paragraphs[:5]])
             if len(text) > 100:  # Need enough text for reliable detection
-                return langdetect.detect(text)
+                return _detect(text)
 
         # If no paragraphs with enough text, try main content areas
         for tag in ["main", "article", "section", "div.content", "div.main"]:
-            content = soup.select(tag)
+            content = tree.css_first(tag)
             if content:
-                text = content[0].get_text().strip()
+                text = content.text().strip()
                 if len(text) > 100:
-                    return langdetect.detect(text)
+                    return _detect(text)
 
         # Fall back to body text if needed
-        body = soup.find("body")
+        body = tree.body
         if body:
-            text = body.get_text().strip()
+            text = body.text().strip()
             if len(text) > 100:
-                return langdetect.detect(text)
+                return _detect(text)
     except:
         pass
 
     return "unknown"
 
 
+# Language indicators in links and resource sections
+_LANGUAGE_INDICATORS = (
+    "/es/",
+    "/fr/",
+    "/de/",
+    "/zh/",
+    "/ru/",
+    "/ja/",
+    "/ar/",
+    "español",
+    "français",
+    "deutsch",
+    "中文",
+    "русский",
+    "日本語",
+    "العربية",
+)
+
+# Find all the indicators in a single pass over the text
+_LANGUAGE_INDICATOR_AC = ahocorasick.Automaton()
+for _indicator in _LANGUAGE_INDICATORS:
+    _LANGUAGE_INDICATOR_AC.add_word(_indicator, _indicator)
+_LANGUAGE_INDICATOR_AC.make_automaton()
+
+
+def _has_language_indicator(text):
+    return next(_LANGUAGE_INDICATOR_AC.iter(text), None) is not None
+
+
 # Function to check for non-English resources
-def check_for_non_english_resources(soup, primary_language):
+def check_for_non_english_resources(tree, primary_language):
     # Skip check if primary language is already non-English
     if primary_language != "en" and primary_language != "unknown":
         return True
 
-    # Look for sections or pages in other languages
-    non_english_indicators = []
-
-    # 1. Check for links containing language indicators
-    language_indicators = [
-        "/es/",
-        "/fr/",
-        "/de/",
-        "/zh/",
-        "/ru/",
-        "/ja/",
-        "/ar/",
-        "español",
-        "français",
-        "deutsch",
-        "中文",
-        "русский",
-        "日本語",
-        "العربية",
-    ]
+    # Look at links and resource sections in a single pass over the tree
+    for el in tree.css("a[href], section[class], div[class]"):
+        if el.tag == "a":
+            # 1. Check for links containing language indicators
+            # (the tab keeps matches from spanning the href and the link text)
+            if _has_language_indicator(
+                _attr(el, "href").lower() + "\t" + el.text().lower()
+            ):
+                return True
+        elif _RESOURCE_RE.search(_attr(el, "class")):
+            # 2. Look for resource sections with translations
+            if _has_language_indicator(el.text().lower()):
+                return True
 
-    for a in soup.find_all("a", href=True):
-        for indicator in language_indicators:
-            if indicator in a["href"].lower() or indicator in a.get_text().lower():
-                non_english_indicators.append(
-                    {
-                        "type": "link_with_language",
-                        "indicator": indicator,
-                        "content": str(a)[:100],
-                    }
-                )
+    return False
 
-    # 2. Look for resource sections with translations
-    resource_sections = soup.find_all(
-        ["section", "div"],
-        class_=re.compile("(resource|publication|paper|documentation)", re.I),
-    )
-    for section in resource_sections:
-        # Look for language indicators within resource sections
-        for indicator in language_indicators:
-            if indicator in section.get_text().lower():
-                non_english_indicators.append(
-                    {
-                        "type": "resource_section",
-                        "indicator": indicator,
-                        "content": section.get_text()[:100],
-                    }
-                )
 
-    return len(non_english_indicators) > 0
+# Set up a parsing worker process with the languages detected so far.
+# The langdetect profiles are loaded when the module is imported, so once per worker
+def _init_worker(lang_cache):
+    _lang_cache.update(lang_cache)
+
+
+# Parse a fetched page and run the language checks on it (CPU-bound, runs in a
+# worker process). Also returns the languages newly detected on the way
+def _analyze_html(html, org):
+    tree = LexborHTMLParser(html)
+
+    # Check for language options (looks into scripts for Google Translate)
+    language_options = detect_language_options(tree)
+
+    # Leave scripts and styles out of the page text from here on
+    tree.strip_tags(["script", "style"])
+
+    # Detect primary language
+    primary_language = detect_primary_language(tree)
+
+    # Check for non-English resources
+    has_non_english_resources = check_for_non_english_resources(tree, primary_language)
+
+    result = {
+        "name": org["name"],
+        "url": org["url"],
+        "status": "success",
+        "primary_language": primary_language,
+        "has_language_options": len(language_options) > 0,
+        "language_options": language_options,
+        "has_non_english_resources": has_non_english_resources,
+    }
+    return result, _pop_new_langs()
+
+
+# Fetch a page, retrying transient connection failures and timeouts
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=1, max=8),
+    retry=retry_if_exception_type((aiohttp.ClientConnectorError, asyncio.TimeoutError)),
+    reraise=True,
+)
+async def _fetch(session, semaphore, url):
+    async with semaphore:
+        async with session.get(
+            url, headers=headers, timeout=REQUEST_TIMEOUT
+        ) as response:
+            if response.status != 200:
+                return response.status, None
+            return response.status, await response.text(errors="replace")
+
+
+def _result_cache_key(url):
+    return f"{ANALYZER_VERSION}:{hashlib.sha1(url.encode('utf-8')).hexdigest()}"
 
 
 # Function to analyze a single website
-def analyze_website(org):
+async def analyze_website(session, semaphore, cache, process_pool, org):
     org_name = org["name"]
     url = org["url"]
 
     print(f"Analyzing: {org_name} - {url}")
 
     try:
-        response = requests.get(url, headers=headers, timeout=15)
-        if response.status_code != 200:
+        # Inside the try so a row without a URL is recorded as an error
+        # instead of ending the whole run
+        cache_key = _result_cache_key(url)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return {**cached, "name": org_name}
+
+        status_code, html = await _fetch(session, semaphore, url)
+        if status_code != 200:
             return {
                 "name": org_name,
                 "url": url,
                 "status": "error",
-                "status_code": response.status_code,
+                "status_code": status_code,
                 "primary_language": None,
                 "has_language_options": False,
                 "language_options": [],
                 "has_non_english_resources": False,
             }
 
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        # Detect primary language
-        primary_language = detect_primary_language(soup)
-
-        # Check for language options
-        language_options = detect_language_options(soup)
-
-        # Check for non-English resources
-        has_non_english_resources = check_for_non_english_resources(
-            soup, primary_language
+        # Parse in another process so other fetches keep going meanwhile
+        loop = asyncio.get_running_loop()
+        result, new_langs = await loop.run_in_executor(
+            process_pool, _analyze_html, html, org
         )
+        _lang_cache.update(new_langs)
 
-        return {
-            "name": org_name,
-            "url": url,
-            "status": "success",
-            "primary_language": primary_language,
-            "has_language_options": len(language_options) > 0,
-            "language_options": language_options,
-            "has_non_english_resources": has_non_english_resources,
-        }
+        cache.set(cache_key, result, expire=RESULT_CACHE_EXPIRE)
+        return result
 
     except Exception as e:
         return {
@@ -446,50 +657,101 @@ def analyze_website(org):
         }
 
 
+# What is kept in memory for each organization: everything but the language options
+@dataclass
+class _SlimResult:
+    name: str
+    url: str
+    status: str
+    primary_language: str | None
+    has_language_options: bool
+    has_non_english_resources: bool
+    status_code: int | None = None
+    error: str | None = None
+
+
+# Tag a coroutine's result with the position of its organization in the input
+async def _indexed(index, coro):
+    return index, await coro
+
+
+# Analyze all organizations concurrently over a single HTTP session.
+# Full results are streamed to FULL_ANALYSIS_FILE as they complete, tagged with
+# the organization's position in the input, and slim ones are returned in input order
+async def analyze_websites(orgs):
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    # Reuse connections across organizations hosted on the same server,
+    # without hitting any single host too hard
+    connector = aiohttp.TCPConnector(limit_per_host=2, keepalive_timeout=30)
+    # Parse pages on all cores, outside of the GIL. Workers are spawned rather
+    # than forked, as they start inside the running event loop, alongside
+    # aiohttp's resolver threads
+    process_pool = ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(_lang_cache,),
+    )
+    results = [None] * len(orgs)
+    with (
+        open(FULL_ANALYSIS_FILE, "wb") as f,
+        Cache(RESULT_CACHE_DIR) as cache,
+        process_pool,
+    ):
+        async with aiohttp.ClientSession(connector=connector) as session:
+            tasks = [
+                _indexed(
+                    index, analyze_website(session, semaphore, cache, process_pool, org)
+                )
+                for index, org in enumerate(orgs)
+            ]
+            for task in tqdm.as_completed(tasks, total=len(tasks)):
+                index, result = await task
+                f.write(
+                    orjson.dumps(
+                        {"index": index, **result}, option=orjson.OPT_NON_STR_KEYS
+                    )
+                    + b"\n"
+                )
+                f.flush()
+                del result["language_options"]
+                results[index] = _SlimResult(**result)
+    return results
+
+
 # Main function to analyze all organizations
 def analyze_ai_safety_organizations(csv_file="ai_safety_organizations.csv"):
-    # Load organizations from CSV
-    df = pd.read_csv(csv_file)
+    # Load organizations from CSV (only the columns we use). Blank cells are
+    # read as "" rather than pd.NA, which orjson can't write out
+    df = pd.read_csv(
+        csv_file,
+        usecols=["name", "url"],
+        dtype={"name": "string", "url": "string"},
+        keep_default_na=False,
+    )
     print(f"Loaded {len(df)} organizations from {csv_file}")
 
     # Limit to first N organizations for testing
     # df = df.head(1)
 
-    # Initialize results list
-    results = []
-
-    # Option 1: Sequential processing (more reliable but slower)
-    # for _, org in tqdm(df.iterrows(), total=len(df)):
-    #     result = analyze_website(org)
-    #     results.append(result)
-
-    # Option 2: Parallel processing (faster but may get blocked)
-    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-        future_to_org = {
-            executor.submit(analyze_website, row.to_dict()): row.to_dict()
-            for _, row in df.iterrows()
-        }
-        for future in tqdm(
-            concurrent.futures.as_completed(future_to_org), total=len(future_to_org)
-        ):
-            results.append(future.result())
+    orgs = [
+        {"name": name, "url": url}
+        for name, url in zip(df["name"].tolist(), df["url"].tolist())
+    ]
+    load_lang_cache()
+    results = asyncio.run(analyze_websites(orgs))
+    save_lang_cache()
 
     # Convert results to DataFrame
     results_df = pd.DataFrame(results)
 
     # Calculate statistics
-    total_success = len(results_df[results_df["status"] == "success"])
-    english_sites = len(
-        results_df[
-            (results_df["status"] == "success")
-            & (results_df["primary_language"] == "en")
-        ]
-    )
-    sites_with_language_options = len(
-        results_df[results_df["has_language_options"] == True]
-    )
-    sites_with_non_english_resources = len(
-        results_df[results_df["has_non_english_resources"] == True]
+    success = results_df["status"].eq("success")
+    total_success = int(success.sum())
+    english_sites = int((success & results_df["primary_language"].eq("en")).sum())
+    sites_with_language_options = int(results_df["has_language_options"].sum())
+    sites_with_non_english_resources = int(
+        results_df["has_non_english_resources"].sum()
     )
 
     # Print results
@@ -505,22 +767,19 @@ def analyze_ai_safety_organizations(csv_file="ai_safety_organizations.csv"):
         f"Websites with non-English resources: {sites_with_non_english_resources} ({sites_with_non_english_resources/total_success*100:.1f}% if successful)"
     )
 
-    # Save detailed results (excluding large language_options field)
-    results_df_slim = (
-        results_df.drop(columns=["language_options"])
-        if "language_options" in results_df.columns
-        else results_df
-    )
-    results_df_slim.to_csv("generated/ai_safety_language_analysis.csv", index=False)
+    # Save detailed results (the language options are already in FULL_ANALYSIS_FILE)
+    results_df.to_csv("generated/ai_safety_language_analysis.csv", index=False)
     print("Detailed results saved to ai_safety_language_analysis.csv")
-
-    # Save full results with language options as JSON for detailed inspection
-    import json
-
-    with open("generated/ai_safety_language_full_analysis.json", "w") as f:
-        json.dump(results, f, indent=2)
+    # Also keep them typed in Parquet, for fast reloading in print_stats.py
+    results_df.to_parquet(
+        "generated/ai_safety_language_analysis.parquet",
+        engine="pyarrow",
+        compression="zstd",
+        index=False,
+    )
+    print("Detailed results saved to ai_safety_language_analysis.parquet")
     print(
-        "Full analysis with language option details saved to ai_safety_language_full_analysis.json"
+        "Full analysis with language option details saved to ai_safety_language_full_analysis.ndjson"
     )
 
     # Return key stats for the blog post
@@ -0,0 +1,210 @@
+import pytest
+from selectolax.lexbor import LexborHTMLParser
+
+from sail_scripts.translation_coverage import (
+    _match_language_name,
+    check_for_non_english_resources,
+    detect_language_options,
+    detect_primary_language,
+)
+
+
+def _tree(body, head=""):
+    return LexborHTMLParser(f"<html><head>{head}</head><body>{body}</body></html>")
+
+
+def _types(options):
+    return [option["type"] for option in options]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("english", "en"),
+        ("español", "es"),
+        ("日本語", "ja"),
+        ("fr", "fr"),
+        ("english (uk)", "en"),
+        ("deutsch version", "de"),
+        ("englishman", None),
+        ("news", None),
+        ("", None),
+    ],
+)
+def test_match_language_name(text, expected):
+    assert _match_language_name(text) == expected
+
+
+def test_no_language_options_on_plain_page():
+    tree = _tree("<nav><a href='/about'>About</a><a href='/blog'>Blog</a></nav>")
+    assert detect_language_options(tree) == []
+
+
+def test_language_select_by_option_values():
+    tree = _tree(
+        "<select name='choice'>"
+        "<option value='en'>EN</option>"
+        "<option value='fr-FR'>FR</option>"
+        "<option value='de_DE'>DE</option>"
+        "</select>"
+    )
+    options = detect_language_options(tree)
+    assert _types(options) == ["language_select"]
+    assert options[0]["matched_codes"] == 3
+
+
+def test_language_select_by_option_texts():
+    tree = _tree("<select><option>English</option><option>Français</option></select>")
+    options = detect_language_options(tree)
+    assert _types(options) == ["language_select"]
+    assert options[0]["matched_names"] == 2
+
+
+def test_select_without_languages_is_ignored():
+    tree = _tree(
+        "<select><option value='1'>One</option><option value='2'>Two</option></select>"
+    )
+    assert detect_language_options(tree) == []
+
+
+def test_language_menu_by_paths_and_names():
+    tree = _tree(
+        "<nav>"
+        "<a href='/en/'>Home</a>"
+        "<a href='/fr/'>Accueil</a>"
+        "<a href='/page?lang=de'>Deutsch</a>"
+        "</nav>"
+    )
+    options = detect_language_options(tree)
+    assert _types(options) == ["language_menu"]
+    assert set(options[0]["matched_paths"]) == {"en", "fr", "de"}
+    assert options[0]["matched_names"] == ["de"]
+
+
+def test_explicit_language_nav_needs_a_single_match():
+    tree = _tree(
+        "<ul class='lang-switcher'>"
+        "<li><a href='/'>Home</a></li>"
+        "<li><a href='/other'>Español</a></li>"
+        "</ul>"
+    )
+    options = detect_language_options(tree)
+    assert _types(options) == ["language_menu"]
+    assert options[0]["matched_names"] == ["es"]
+
+
+def test_excluded_domains_are_not_language_menus():
+    tree = _tree(
+        "<nav>"
+        "<a href='https://scholar.google.com/citations?hl=fr'>Scholar</a>"
+        "<a href='https://twitter.com/fr/'>Twitter</a>"
+        "<a href='https://linkedin.com/de/'>LinkedIn</a>"
+        "</nav>"
+    )
+    assert detect_language_options(tree) == []
+
+
+def test_large_containers_are_not_language_menus():
+    links = "".join(f"<a href='/{code}/'>{code}</a>" for code in ("en", "fr", "de"))
+    filler = "<span>x</span>" * 20
+    tree = _tree(f"<div>{links}{filler}</div>")
+    assert detect_language_options(tree) == []
+
+
+def test_id_exact_match():
+    tree = _tree("<span id='languageSwitcher'><button>EN</button></span>")
+    options = detect_language_options(tree)
+    assert _types(options) == ["id_exact_match"]
+    assert options[0]["pattern"] == "languageSwitcher"
+
+
+def test_id_exact_match_needs_a_control():
+    tree = _tree("<span id='languageSwitcher'>EN</span>")
+    assert detect_language_options(tree) == []
+
+
+def test_alternate_hreflang():
+    tree = _tree(
+        "<select><option value='en'>EN</option><option value='fr'>FR</option></select>",
+        head=(
+            "<link rel='alternate' hreflang='en' href='/en/'>"
+            "<link rel='alternate' hreflang='x-default' href='/'>"
+            "<link rel='alternate' hreflang='FR' href='/fr/'>"
+            "<link rel='alternate' hreflang='de' href='/de/'>"
+        ),
+    )
+    options = detect_language_options(tree)
+    # hreflang is enough on its own, the other approaches are skipped
+    assert _types(options) == ["alternate_hreflang"]
+    assert set(options[0]["languages"]) == {"fr", "de"}
+    assert options[0]["count"] == 2
+
+
+def test_google_translate_element():
+    tree = _tree("<div id='google_translate_element'></div>")
+    options = detect_language_options(tree)
+    assert _types(options) == ["google_translate"]
+    assert options[0]["content"]["id"] == "google_translate_element"
+
+
+def test_google_translate_script():
+    tree = _tree(
+        "<script>function init() {"
+        " new google.translate.TranslateElement({pageLanguage: 'en'}, 'gt');"
+        "}</script>"
+    )
+    assert _types(detect_language_options(tree)) == ["google_translate_script"]
+
+
+def test_primary_language_from_html_lang():
+    tree = LexborHTMLParser("<html lang='en-US'><body><p>Bonjour</p></body></html>")
+    assert detect_primary_language(tree) == "en"
+
+
+def test_primary_language_from_meta():
+    tree = _tree("", head="<meta http-equiv='content-language' content='fr-FR'>")
+    assert detect_primary_language(tree) == "fr"
+
+
+def test_primary_language_from_paragraphs():
+    tree = _tree(
+        "<p>Die künstliche Intelligenz verändert unsere Gesellschaft grundlegend.</p>"
+        "<p>Deshalb müssen wir gemeinsam darüber nachdenken, wie wir diese"
+        " Technologie sicher und verantwortungsvoll gestalten können.</p>"
+    )
+    assert detect_primary_language(tree) == "de"
+
+
+def test_primary_language_unknown_without_enough_text():
+    assert detect_primary_language(_tree("<p>Hello</p>")) == "unknown"
+
+
+def test_non_english_primary_language_has_resources():
+    assert check_for_non_english_resources(_tree(""), "fr") is True
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        "<a href='/es/guide'>Guide</a>",
+        "<a href='/guide'>Español</a>",
+        "<section class='Publications'><p>Available in 中文</p></section>",
+        "<div class='resource-list'><p>Auch auf Deutsch</p></div>",
+    ],
+)
+def test_non_english_resources(body):
+    assert check_for_non_english_resources(_tree(body), "en") is True
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        "<a href='/guide'>Guide</a>",
+        # Indicators outside links and resource sections don't count
+        "<div class='footer'><p>Auch auf Deutsch</p></div>",
+        # A match can't span the href and the link text
+        "<a href='/docs/e'>s/</a>",
+    ],
+)
+def test_no_non_english_resources(body):
+    assert check_for_non_english_resources(_tree(body), "unknown") is False